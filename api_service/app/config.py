@@ -3,30 +3,38 @@ API Configuration.
 """
 
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
 
-load_dotenv()
+# Containers inject env directly, so they can skip reading .env from disk
+if os.environ.get('SKIP_DOTENV') != '1':
+    load_dotenv()
 
+# Snapshot env once; every setting below reads from this dict
+_ENV = dict(os.environ)
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """API configuration"""
-    
+    """API configuration (read-only, resolved at import)"""
+
     # Flask
-    DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
-    HOST = os.getenv('API_HOST', '0.0.0.0')
-    PORT = int(os.getenv('API_PORT', '5002'))
-    
+    DEBUG: bool = _ENV.get('DEBUG', 'False').lower() == 'true'
+    HOST: str = _ENV.get('API_HOST', '0.0.0.0')
+    PORT: int = int(_ENV.get('API_PORT', '5002'))
+
     # Redis
-    REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
-    REDIS_PORT = int(os.getenv('REDIS_PORT', '6379'))
-    REDIS_DB = int(os.getenv('REDIS_DB', '0'))
-    CACHE_TTL = int(os.getenv('CACHE_TTL', '3600'))  # 1 hour
-    
+    REDIS_HOST: str = _ENV.get('REDIS_HOST', 'localhost')
+    REDIS_PORT: int = int(_ENV.get('REDIS_PORT', '6379'))
+    REDIS_DB: int = int(_ENV.get('REDIS_DB', '0'))
+    CACHE_TTL: int = int(_ENV.get('CACHE_TTL', '3600'))  # 1 hour
+
     # Model
-    MODEL_PATH = os.getenv('MODEL_PATH', '../ml_service/saved_models/fire_risk_xgboost_v1.pkl')
-    MODEL_VERSION = 'v1.0'
-    
+    MODEL_PATH: str = _ENV.get('MODEL_PATH', '../ml_service/saved_models/fire_risk_xgboost_v1.ubj')
+    MODEL_VERSION: str = 'v1.0'
+    MODEL_NTHREAD: int = int(_ENV.get('MODEL_NTHREAD', '1'))  # Per worker
+
     # API Settings
-    MAX_BATCH_SIZE = 100  # Max predictions per request
-    RATE_LIMIT = 100  # Requests per minute
+    MAX_BATCH_SIZE: int = 100  # Max predictions per request
+    RATE_LIMIT: int = 100  # Requests per minute
 
-config = Config()
\ No newline at end of file
+config = Config()
@@ -44,6 +44,4 @@ def create_app():
             }
         }
     
-    # Add this at the very bottom of the file
-    app = create_app()  
     return app
\ No newline at end of file
@@ -8,10 +8,15 @@ PYDANTIC:
 - Auto-generated documentation
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
 
+# Defaults for the optional inputs. Explicit nulls are mapped to these too
+# (cache key and model features), so null and omitted score identically.
+DEFAULT_WIND_DIRECTION = 0.0
+DEFAULT_PRESSURE = 1013.0
+
 class PredictionRequest(BaseModel):
     """
     Single prediction request.
@@ -58,30 +63,19 @@ class PredictionRequest(BaseModel):
     )
     
     wind_direction: Optional[float] = Field(
-        0,
+        DEFAULT_WIND_DIRECTION,
         ge=0,
         le=360,
         description="Wind direction in degrees"
     )
     
     pressure: Optional[float] = Field(
-        1013,
+        DEFAULT_PRESSURE,
         ge=900,
         le=1100,
         description="Atmospheric pressure in hPa"
     )
     
-    @validator('temperature')
-    def validate_temperature(cls, v):
-        """
-        Custom validation for temperature.
-        
-        WHY: Add business logic beyond simple ranges
-        """
-        if v < -50 or v > 150:
-            raise ValueError('Temperature out of realistic range')
-        return v
-    
     class Config:
         """Pydantic config"""
         json_schema_extra = {
@@ -106,6 +100,12 @@ class BatchPredictionRequest(BaseModel):
     )
 
 
+# Compiled validators, captured once at import. Routes call these directly
+# (validate_json on raw request bytes) instead of going through __init__.
+PREDICTION_VALIDATOR = PredictionRequest.__pydantic_validator__
+BATCH_VALIDATOR = BatchPredictionRequest.__pydantic_validator__
+
+
 class PredictionResponse(BaseModel):
     """Single prediction response"""
     
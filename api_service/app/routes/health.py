@@ -2,14 +2,22 @@
 Health check and monitoring endpoints.
 """
 
-from flask import Blueprint, jsonify
-from app.services.prediction_service import prediction_service
-from app.services.cache_service import cache_service
+from flask import Blueprint, Response
+from app.services.prediction_service import get_prediction_service
+from app.services.cache_service import get_cache_service
 from app.config import config
+from app.utils.responses import ojsonify
 from datetime import datetime
+import json
 
 health_bp = Blueprint('health', __name__)
 
+# Liveness body never changes, so serialize it once at import
+_HEALTH_BODY = json.dumps({
+    'status': 'healthy',
+    'version': config.MODEL_VERSION
+}).encode()
+
 @health_bp.route('/health', methods=['GET'])
 def health_check():
     """
@@ -19,12 +27,11 @@ def health_check():
     - Load balancers
     - Kubernetes
     - Monitoring systems
+    
+    Probed every few seconds, so it returns a pre-built body.
+    Component checks live in /health/detailed.
     """
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'version': config.MODEL_VERSION
-    }), 200
+    return Response(_HEALTH_BODY, status=200, mimetype='application/json')
 
 
 @health_bp.route('/health/detailed', methods=['GET'])
@@ -32,12 +39,12 @@ def detailed_health():
     """
     Detailed health check with component status.
     """
-    model_loaded = prediction_service.model is not None
-    cache_stats = cache_service.get_stats()
+    model_loaded = get_prediction_service().model is not None
+    cache_stats = get_cache_service().get_stats()
     
     status = 'healthy' if model_loaded and cache_stats.get('connected') else 'degraded'
     
-    return jsonify({
+    return ojsonify({
         'status': status,
         'timestamp': datetime.now().isoformat(),
         'components': {
@@ -47,85 +54,35 @@ def detailed_health():
             },
             'cache': cache_stats
         }
-    }), 200
+    }, 200)
 
 
 @health_bp.route('/metrics', methods=['GET'])
 def metrics():
     """
-    Prometheus-style metrics endpoint.
-    """
-    cache_stats = cache_service.get_stats()
-    
-    return jsonify({
-        'cache_hits': cache_stats.get('hits', 0),
-        'cache_misses': cache_stats.get('misses', 0),
-        'cache_hit_rate': cache_stats.get('hit_rate', 0),
-        'total_cached_keys': cache_stats.get('total_keys', 0)
-    }), 200
-
-"""
-Health check and monitoring endpoints.
-"""
-
-from flask import Blueprint, jsonify
-from app.services.prediction_service import prediction_service
-from app.services.cache_service import cache_service
-from app.config import config
-from datetime import datetime
-
-health_bp = Blueprint('health', __name__)
-
-@health_bp.route('/health', methods=['GET'])
-def health_check():
-    """
-    Basic health check.
+    Prometheus metrics endpoint (text exposition format).
     
-    Used by:
-    - Load balancers
-    - Kubernetes
-    - Monitoring systems
-    """
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'version': config.MODEL_VERSION
-    }), 200
-
-
-@health_bp.route('/health/detailed', methods=['GET'])
-def detailed_health():
-    """
-    Detailed health check with component status.
+    Plain text so scrapers skip JSON parsing; cache stats are
+    served from a short in-process snapshot (see CacheService.get_stats).
     """
-    model_loaded = prediction_service.model is not None
-    cache_stats = cache_service.get_stats()
-    
-    status = 'healthy' if model_loaded and cache_stats.get('connected') else 'degraded'
+    cache_stats = get_cache_service().get_stats()
     
-    return jsonify({
-        'status': status,
-        'timestamp': datetime.now().isoformat(),
-        'components': {
-            'model': {
-                'loaded': model_loaded,
-                'version': config.MODEL_VERSION
-            },
-            'cache': cache_stats
-        }
-    }), 200
-
-
-@health_bp.route('/metrics', methods=['GET'])
-def metrics():
-    """
-    Prometheus-style metrics endpoint.
-    """
-    cache_stats = cache_service.get_stats()
+    body = (
+        '# HELP emberalert_cache_connected Whether Redis is reachable\n'
+        '# TYPE emberalert_cache_connected gauge\n'
+        f"emberalert_cache_connected {int(cache_stats.get('connected', False))}\n"
+        '# HELP emberalert_cache_hits_total Redis keyspace hits\n'
+        '# TYPE emberalert_cache_hits_total counter\n'
+        f"emberalert_cache_hits_total {cache_stats.get('hits', 0)}\n"
+        '# HELP emberalert_cache_misses_total Redis keyspace misses\n'
+        '# TYPE emberalert_cache_misses_total counter\n'
+        f"emberalert_cache_misses_total {cache_stats.get('misses', 0)}\n"
+        '# HELP emberalert_cache_hit_rate_percent Cache hit rate (0-100)\n'
+        '# TYPE emberalert_cache_hit_rate_percent gauge\n'
+        f"emberalert_cache_hit_rate_percent {cache_stats.get('hit_rate', 0)}\n"
+        '# HELP emberalert_cache_keys Keys stored in the Redis database\n'
+        '# TYPE emberalert_cache_keys gauge\n'
+        f"emberalert_cache_keys {cache_stats.get('total_keys', 0)}\n"
+    )
     
-    return jsonify({
-        'cache_hits': cache_stats.get('hits', 0),
-        'cache_misses': cache_stats.get('misses', 0),
-        'cache_hit_rate': cache_stats.get('hit_rate', 0),
-        'total_cached_keys': cache_stats.get('total_keys', 0)
-    }), 200
\ No newline at end of file
+    return Response(body, status=200, mimetype='text/plain; version=0.0.4')
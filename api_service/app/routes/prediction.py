@@ -2,15 +2,15 @@
 Prediction API endpoints.
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request
 from app.models.schemas import (
-    PredictionRequest,
-    BatchPredictionRequest,
-    PredictionResponse,
-    BatchPredictionResponse
+    PREDICTION_VALIDATOR,
+    BATCH_VALIDATOR
 )
-from app.services.prediction_service import prediction_service
+from app.services.prediction_service import get_prediction_service
+from app.utils.responses import ojsonify
 from pydantic import ValidationError
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -44,29 +44,31 @@ def predict():
         }
     """
     try:
-        # Validate request
-        data = request.get_json()
-        validated = PredictionRequest(**data)
+        # Validate raw JSON body in one pass (no get_json() + re-validate)
+        validated = PREDICTION_VALIDATOR.validate_json(
+            request.get_data(cache=False)
+        )
         
-        # Make prediction
-        result = prediction_service.predict_single(validated.dict())
+        # Make prediction (already encoded; cache hits skip re-serializing)
+        body = get_prediction_service().predict_single_json(validated.model_dump())
         
         # Return response
-        return jsonify(result), 200
+        return Response(body, status=200, mimetype='application/json')
         
     except ValidationError as e:
         # Pydantic validation error
-        return jsonify({
+        return ojsonify({
             'error': 'Validation error',
-            'details': e.errors()
-        }), 400
+            # e.json() copes with raw-bytes input on malformed bodies
+            'details': json.loads(e.json())
+        }, 400)
         
     except Exception as e:
         logger.error(f"Prediction error: {e}")
-        return jsonify({
+        return ojsonify({
             'error': 'Prediction failed',
             'message': str(e)
-        }), 500
+        }, 500)
 
 
 @prediction_bp.route('/predict/batch', methods=['POST'])
@@ -90,33 +92,36 @@ def predict_batch():
         }
     """
     try:
-        data = request.get_json()
-        validated = BatchPredictionRequest(**data)
+        # Validate the whole envelope once; items are trusted from here on
+        validated = BATCH_VALIDATOR.validate_json(
+            request.get_data(cache=False)
+        )
         
-        # Make batch predictions
-        requests_list = [p.dict() for p in validated.predictions]
-        results = prediction_service.predict_batch(requests_list)
+        # Make batch predictions (single dump, no per-item .dict())
+        requests_list = validated.model_dump()['predictions']
+        results = get_prediction_service().predict_batch(requests_list)
         
         response = {
             'predictions': results,
             'total': len(results),
-            'model_version': prediction_service.model_version
+            'model_version': get_prediction_service().model_version
         }
         
-        return jsonify(response), 200
+        return ojsonify(response, 200)
         
     except ValidationError as e:
-        return jsonify({
+        return ojsonify({
             'error': 'Validation error',
-            'details': e.errors()
-        }), 400
+            # e.json() copes with raw-bytes input on malformed bodies
+            'details': json.loads(e.json())
+        }, 400)
         
     except Exception as e:
         logger.error(f"Batch prediction error: {e}")
-        return jsonify({
+        return ojsonify({
             'error': 'Batch prediction failed',
             'message': str(e)
-        }), 500
+        }, 500)
 
 
 @prediction_bp.route('/model/info', methods=['GET'])
@@ -131,8 +136,8 @@ def model_info():
             "features": [...]
         }
     """
-    return jsonify({
-        'version': prediction_service.model_version,
+    return ojsonify({
+        'version': get_prediction_service().model_version,
         'model_type': 'XGBoost Regressor',
-        'model_loaded': prediction_service.model is not None
-    }), 200
\ No newline at end of file
+        'model_loaded': get_prediction_service().model is not None
+    }, 200)
\ No newline at end of file
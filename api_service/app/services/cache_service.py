@@ -3,15 +3,28 @@ Redis caching service.
 
 CACHING STRATEGY:
 - Cache predictions by location + conditions
-- TTL: 1 hour (weather changes slowly)
+- Inputs are quantized before keying, so near-duplicate queries share
+  an entry:
+    lat/lon          0.01° (~1 km)
+    temperature      1°F
+    humidity         1%
+    wind speed       1 mph
+    wind direction   45° (8 compass sectors)
+    pressure         1 hPa
+- TTL scales with risk level (see PredictionService.CACHE_TTL_BY_LEVEL):
+  stable LOW-risk entries live longer, EXTREME entries refresh fast
 - Reduces API response time by ~85%
 """
 
 import redis
-import json
-import hashlib
-from typing import Optional
+import orjson
+import struct
+import time
+import xxhash
+from functools import cache
+from typing import List, Optional
 from app.config import config
+from app.models.schemas import DEFAULT_PRESSURE, DEFAULT_WIND_DIRECTION
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,32 +32,60 @@ logger = logging.getLogger(__name__)
 class CacheService:
     """Redis cache manager"""
     
+    STATS_TTL = 5.0  # Seconds to reuse get_stats() results
+    
     def __init__(self):
+        """
+        Defer the Redis connection until first use.
+        
+        With Gunicorn preload_app the service is created in the master;
+        connecting lazily gives each forked worker its own socket.
+        """
+        self._pool = None
+        self._redis_client = None
+        self._connect_attempted = False
+        self._stats = None  # (monotonic timestamp, stats dict)
+    
+    @property
+    def redis_client(self) -> Optional[redis.Redis]:
+        """Redis client, connected on first access (None if unavailable)"""
+        if not self._connect_attempted:
+            self._connect_attempted = True
+            self._redis_client = self._connect()
+        return self._redis_client
+    
+    def _connect(self) -> Optional[redis.Redis]:
         """Connect to Redis"""
         try:
-            self.redis_client = redis.Redis(
+            # Pooled connections; redis-py picks the hiredis C parser if installed
+            self._pool = redis.BlockingConnectionPool(
                 host=config.REDIS_HOST,
                 port=config.REDIS_PORT,
                 db=config.REDIS_DB,
-                decode_responses=True  # Return strings, not bytes
+                max_connections=64,
+                timeout=1  # Seconds to wait for a free connection
             )
+            # Keep raw bytes; orjson decodes them directly
+            client = redis.Redis(connection_pool=self._pool, decode_responses=False)
             
             # Test connection
-            self.redis_client.ping()
+            client.ping()
             logger.info("Redis connected successfully")
+            return client
             
         except redis.ConnectionError as e:
             logger.warning(f"Redis connection failed: {e}")
-            self.redis_client = None
+            return None
     
     def _generate_key(self, data: dict) -> str:
         """
         Generate cache key from request data.
         
         KEY STRATEGY:
-        - Hash input parameters
-        - Ensures unique key per unique input
-        - Short keys (MD5 hash = 32 chars)
+        - Quantize inputs (see module docstring) so nearby/near-identical
+          queries collapse onto one entry
+        - Pack the 7 quantized values into a fixed 56-byte buffer
+        - xxh3-128 hash (non-cryptographic, much faster than MD5)
         
         Args:
             data: Request parameters
@@ -52,14 +93,22 @@ class CacheService:
         Returns:
             Cache key string
         """
-        # Sort dict for consistent hashing
-        sorted_data = json.dumps(data, sort_keys=True)
+        # None (explicit null) -> default, same as the model features
+        wind_direction = data.get('wind_direction') or DEFAULT_WIND_DIRECTION
+        pressure = data.get('pressure') or DEFAULT_PRESSURE
         
-        # MD5 hash (fast, suitable for caching)
-        hash_object = hashlib.md5(sorted_data.encode())
-        cache_key = f"prediction:{hash_object.hexdigest()}"
+        buf = struct.pack(
+            '<7d',
+            round(data['latitude'], 2),
+            round(data['longitude'], 2),
+            round(data['temperature']),
+            round(data['humidity']),
+            round(data['wind_speed']),
+            round(wind_direction / 45) * 45 % 360,
+            round(pressure)
+        )
         
-        return cache_key
+        return f"prediction:{xxhash.xxh3_128_hexdigest(buf)}"
     
     def get(self, request_data: dict) -> Optional[dict]:
         """
@@ -80,7 +129,7 @@ class CacheService:
             
             if cached:
                 logger.debug(f"Cache HIT: {key}")
-                return json.loads(cached)
+                return orjson.loads(cached)
             
             logger.debug(f"Cache MISS: {key}")
             return None
@@ -89,6 +138,26 @@ class CacheService:
             logger.error(f"Cache get error: {e}")
             return None
     
+    def get_raw(self, request_data: dict) -> Optional[bytes]:
+        """
+        Get cached prediction as the stored JSON bytes (no decoding).
+        
+        Args:
+            request_data: Request parameters
+        
+        Returns:
+            Encoded prediction or None
+        """
+        if not self.redis_client:
+            return None
+        
+        try:
+            return self.redis_client.get(self._generate_key(request_data))
+            
+        except Exception as e:
+            logger.error(f"Cache get_raw error: {e}")
+            return None
+    
     def set(self, request_data: dict, prediction: dict, ttl: int = None):
         """
         Cache a prediction.
@@ -108,7 +177,7 @@ class CacheService:
             self.redis_client.setex(
                 key,
                 ttl,
-                json.dumps(prediction)
+                orjson.dumps(prediction, option=orjson.OPT_SERIALIZE_NUMPY)
             )
             
             logger.debug(f"Cached: {key} (TTL: {ttl}s)")
@@ -116,6 +185,63 @@ class CacheService:
         except Exception as e:
             logger.error(f"Cache set error: {e}")
     
+    def get_many(self, request_list: List[dict]) -> List[Optional[dict]]:
+        """
+        Get cached predictions for many requests in one round-trip.
+        
+        Args:
+            request_list: List of request parameters
+        
+        Returns:
+            Cached predictions (None for misses), same order as input
+        """
+        if not self.redis_client or not request_list:
+            return [None] * len(request_list)
+        
+        try:
+            keys = [self._generate_key(req) for req in request_list]
+            cached = self.redis_client.mget(keys)
+            
+            return [orjson.loads(c) if c else None for c in cached]
+            
+        except Exception as e:
+            logger.error(f"Cache get_many error: {e}")
+            return [None] * len(request_list)
+    
+    def set_many(
+        self,
+        request_list: List[dict],
+        predictions: List[dict],
+        ttls: Optional[List[int]] = None
+    ):
+        """
+        Cache many predictions using a single pipelined round-trip.
+        
+        Args:
+            request_list: List of request parameters
+            predictions: Prediction results, same order as request_list
+            ttls: Per-entry time to live in seconds (default from config)
+        """
+        if not self.redis_client or not request_list:
+            return
+        
+        try:
+            ttls = ttls or [config.CACHE_TTL] * len(request_list)
+            pipe = self.redis_client.pipeline(transaction=False)
+            
+            for req, prediction, ttl in zip(request_list, predictions, ttls):
+                pipe.setex(
+                    self._generate_key(req),
+                    ttl,
+                    orjson.dumps(prediction, option=orjson.OPT_SERIALIZE_NUMPY)
+                )
+            
+            pipe.execute()
+            logger.debug(f"Cached {len(request_list)} predictions")
+            
+        except Exception as e:
+            logger.error(f"Cache set_many error: {e}")
+    
     def clear_all(self):
         """Clear all cached predictions"""
         if not self.redis_client:
@@ -133,14 +259,23 @@ class CacheService:
             logger.error(f"Cache clear error: {e}")
     
     def get_stats(self) -> dict:
-        """Get cache statistics"""
+        """
+        Get cache statistics.
+        
+        INFO + DBSIZE results are reused for STATS_TTL seconds so frequent
+        scrapes across pods don't hammer Redis.
+        """
         if not self.redis_client:
             return {'connected': False}
         
+        now = time.monotonic()
+        if self._stats is not None and now - self._stats[0] < self.STATS_TTL:
+            return self._stats[1]
+        
         try:
             info = self.redis_client.info('stats')
             
-            return {
+            stats = {
                 'connected': True,
                 'total_keys': self.redis_client.dbsize(),
                 'hits': info.get('keyspace_hits', 0),
@@ -150,6 +285,8 @@ class CacheService:
                     info.get('keyspace_misses', 0)
                 )
             }
+            self._stats = (now, stats)
+            return stats
             
         except Exception as e:
             logger.error(f"Stats error: {e}")
@@ -162,5 +299,11 @@ class CacheService:
             return 0.0
         return (hits / total) * 100
 
-# Global cache instance
-cache_service = CacheService()
\ No newline at end of file
+@cache
+def get_cache_service() -> CacheService:
+    """
+    Process-wide cache instance, created on first use.
+    
+    Importing this module no longer connects to anything.
+    """
+    return CacheService()
\ No newline at end of file
@@ -4,24 +4,48 @@ Loads model and makes predictions.
 """
 
 import numpy as np
-import pandas as pd
+import orjson
+from functools import cache
 from typing import Dict, List
 import joblib
+import xgboost as xgb
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 from app.config import config
-from app.services.cache_service import cache_service
+from app.models.schemas import DEFAULT_PRESSURE, DEFAULT_WIND_DIRECTION
+from app.services.cache_service import get_cache_service
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Model input columns, in training order
+FEATURE_NAMES = [
+    'temperature', 'humidity', 'wind_speed', 'wind_direction',
+    'pressure', 'month', 'hour', 'day_of_year'
+]
+
 class PredictionService:
     """Fire risk prediction service"""
     
+    # Cache TTL (seconds) per risk level: high-risk predictions sit near
+    # decision thresholds and must refresh fast; LOW risk is stable.
+    CACHE_TTL_BY_LEVEL = {
+        'LOW': 7200,
+        'MODERATE': 3600,
+        'HIGH': 900,
+        'EXTREME': 300
+    }
+    
     def __init__(self):
         """Load ML model"""
         self.model = None
+        self._booster = None
         self.model_version = config.MODEL_VERSION
+        
+        # Risk level cut points (see _get_risk_level), for batch bucketing
+        self._thresh = np.array([0.3, 0.6, 0.8])
+        self._labels = ('LOW', 'MODERATE', 'HIGH', 'EXTREME')
+        
         self.load_model()
     
     def load_model(self):
@@ -32,9 +56,22 @@ class PredictionService:
             if not model_path.exists():
                 raise FileNotFoundError(f"Model not found: {model_path}")
             
-            # Load model using joblib
-            model_data = joblib.load(model_path)
-            self.model = model_data['model']
+            if model_path.suffix == '.pkl':
+                # Legacy pickled XGBRegressor; mmap_mode maps any NumPy
+                # arrays read-only, so workers share them via the page cache
+                model_data = joblib.load(model_path, mmap_mode='r')
+                self.model = model_data['model']
+                self._booster = self.model.get_booster()
+            else:
+                # Native XGBoost model (.ubj / .json): no pickle, fast load
+                self._booster = xgb.Booster()
+                self._booster.load_model(str(model_path))
+                self.model = self._booster
+            
+            # Predict on the raw booster: inplace_predict reads NumPy buffers
+            # directly, no DMatrix per call. Pin threads so workers don't
+            # oversubscribe cores.
+            self._booster.set_param({'nthread': config.MODEL_NTHREAD})
             
             logger.info(f"Model loaded: {model_path}")
             
@@ -58,18 +95,54 @@ class PredictionService:
         Returns:
             Prediction with risk score and level
         """
+        cache_service = get_cache_service()
         
         # Try cache first
         cached = cache_service.get(request_data)
         if cached:
+            # Keys are rounded, so echo back the caller's exact coordinates
+            cached['latitude'] = request_data['latitude']
+            cached['longitude'] = request_data['longitude']
             cached['from_cache'] = True
             return cached
         
-        # Prepare features
-        features = self._prepare_features(request_data)
+        return self._predict_uncached(request_data)
+    
+    def predict_single_json(self, request_data: Dict) -> bytes:
+        """
+        Make single prediction, returned as encoded JSON.
+        
+        Cache hits are spliced straight from the stored bytes
+        (no decode + re-encode round-trip through a dict).
+        
+        Args:
+            request_data: Input features
+        
+        Returns:
+            JSON bytes of the prediction
+        """
+        raw = get_cache_service().get_raw(request_data)
+        if raw:
+            # Stored entries omit per-request fields; prepend them
+            head = orjson.dumps({
+                'latitude': request_data['latitude'],
+                'longitude': request_data['longitude'],
+                'from_cache': True
+            })
+            return head[:-1] + b',' + raw[1:]
+        
+        return orjson.dumps(
+            self._predict_uncached(request_data),
+            option=orjson.OPT_SERIALIZE_NUMPY
+        )
+    
+    def _predict_uncached(self, request_data: Dict) -> Dict:
+        """Run the model for one request and cache the result"""
+        # Prepare features (1-row matrix)
+        features = self._prepare_features_batch([request_data])
         
         # Make prediction
-        risk_score = self.model.predict(features)[0]
+        risk_score = self._booster.inplace_predict(features)[0]
         risk_score = float(np.clip(risk_score, 0, 1))
         
         # Determine risk level
@@ -77,6 +150,7 @@ class PredictionService:
         
         # Calculate contributing factors
         factors = self._calculate_factors(request_data)
+        timestamp = datetime.now().isoformat()
         
         # Build response
         prediction = {
@@ -84,14 +158,18 @@ class PredictionService:
             'longitude': request_data['longitude'],
             'risk_score': round(risk_score, 3),
             'risk_level': risk_level,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'model_version': self.model_version,
             'contributing_factors': factors,
             'from_cache': False
         }
         
         # Cache result
-        cache_service.set(request_data, prediction)
+        get_cache_service().set(
+            request_data,
+            self._cacheable(prediction),
+            ttl=self.CACHE_TTL_BY_LEVEL[risk_level]
+        )
         
         return prediction
     
@@ -110,75 +188,124 @@ class PredictionService:
         Returns:
             List of predictions
         """
-        predictions = []
+        cache_service = get_cache_service()
+        
+        # One MGET for the whole batch instead of N round-trips
+        predictions = cache_service.get_many(requests)
         
         # Separate cached and uncached
         uncached_requests = []
         uncached_indices = []
         
-        for i, req in enumerate(requests):
-            cached = cache_service.get(req)
+        for i, (req, cached) in enumerate(zip(requests, predictions)):
             if cached:
+                cached['latitude'] = req['latitude']
+                cached['longitude'] = req['longitude']
                 cached['from_cache'] = True
-                predictions.append(cached)
             else:
                 uncached_requests.append(req)
                 uncached_indices.append(i)
-                predictions.append(None)  # Placeholder
         
         # Batch predict uncached
         if uncached_requests:
-            features_batch = pd.DataFrame([
-                self._prepare_features(req) for req in uncached_requests
-            ])
+            features_batch = self._prepare_features_batch(uncached_requests)
+            risk_scores = np.clip(self._booster.inplace_predict(features_batch), 0, 1)
+            
+            # Bucket all scores in one call; side='right' keeps 0.3 -> MODERATE
+            level_idx = np.searchsorted(self._thresh, risk_scores, side='right')
+            
+            # Contributing factors for every row at once (see _calculate_factors).
+            # Read from the requests in float64, not the float32 model matrix,
+            # so rounding matches the single-prediction path exactly.
+            n = len(uncached_requests)
+            temp = np.fromiter((r['temperature'] for r in uncached_requests), float, n)
+            humidity = np.fromiter((r['humidity'] for r in uncached_requests), float, n)
+            wind = np.fromiter((r['wind_speed'] for r in uncached_requests), float, n)
+            temp_f = np.round(np.maximum(0, (temp - 70) / 40), 3).tolist()
+            humidity_f = np.round(np.maximum(0, (50 - humidity) / 50), 3).tolist()
+            wind_f = np.round(np.minimum(1, wind / 20), 3).tolist()
+            new_predictions = []
             
-            risk_scores = self.model.predict(features_batch)
+            # One timestamp for the whole batch
+            timestamp = datetime.now().isoformat()
             
             # Build responses
-            for i, (req, score) in enumerate(zip(uncached_requests, risk_scores)):
-                score = float(np.clip(score, 0, 1))
-                
+            # .tolist(): round Python floats (float64), as /predict does;
+            # rounding np.float32 can land on a different 3rd decimal
+            for i, (req, score, level) in enumerate(
+                zip(uncached_requests, risk_scores.tolist(), level_idx)
+            ):
                 prediction = {
                     'latitude': req['latitude'],
                     'longitude': req['longitude'],
                     'risk_score': round(score, 3),
-                    'risk_level': self._get_risk_level(score),
-                    'timestamp': datetime.now().isoformat(),
+                    'risk_level': self._labels[level],
+                    'timestamp': timestamp,
                     'model_version': self.model_version,
-                    'contributing_factors': self._calculate_factors(req),
+                    'contributing_factors': {
+                        'temperature_factor': temp_f[i],
+                        'humidity_factor': humidity_f[i],
+                        'wind_factor': wind_f[i]
+                    },
                     'from_cache': False
                 }
-                
-                # Cache it
-                cache_service.set(req, prediction)
+                new_predictions.append(prediction)
                 
                 # Insert at correct position
                 original_idx = uncached_indices[i]
                 predictions[original_idx] = prediction
+            
+            # Cache them all in one pipelined write
+            cache_service.set_many(
+                uncached_requests,
+                [self._cacheable(p) for p in new_predictions],
+                ttls=[
+                    self.CACHE_TTL_BY_LEVEL[p['risk_level']] for p in new_predictions
+                ]
+            )
         
         return predictions
     
-    def _prepare_features(self, request_data: Dict) -> pd.DataFrame:
+    @staticmethod
+    def _cacheable(prediction: Dict) -> Dict:
         """
-        Convert request to model input format.
+        Strip per-request fields before caching.
         
-        Must match training data format exactly!
+        Keys are quantized, so one entry serves many nearby requests;
+        coordinates and from_cache are filled in on every hit.
         """
-        # Extract current time features
-        now = datetime.now()
-        
-        features = {
-            'temperature': request_data['temperature'],
-            'humidity': request_data['humidity'],
-            'wind_speed': request_data['wind_speed'],
-            'wind_direction': request_data.get('wind_direction', 0),
-            'pressure': request_data.get('pressure', 1013),
-            'month': now.month,
-            'hour': now.hour,
-            'day_of_year': now.timetuple().tm_yday
+        return {
+            k: v for k, v in prediction.items()
+            if k not in ('latitude', 'longitude', 'from_cache')
         }
+    
+    def _prepare_features_batch(self, requests: List[Dict]) -> np.ndarray:
+        """
+        Convert requests to one model input matrix.
         
-        return pd.DataFrame([features])
+        Must match training data format exactly (FEATURE_NAMES order)!
+        Rows are filled into a single float32 array, no DataFrames.
+        """
+        features = np.empty((len(requests), len(FEATURE_NAMES)), dtype=np.float32)
+        
+        for i, req in enumerate(requests):
+            row = features[i]
+            row[0] = req['temperature']
+            row[1] = req['humidity']
+            row[2] = req['wind_speed']
+            # Explicit nulls take the defaults (NaN would score as "missing"
+            # while the cache key uses the default)
+            row[3] = req.get('wind_direction') or DEFAULT_WIND_DIRECTION
+            row[4] = req.get('pressure') or DEFAULT_PRESSURE
+        
+        # Time features are identical for every row: compute once and
+        # broadcast (ordinal math avoids building a timetuple)
+        now = datetime.now()
+        features[:, 5] = now.month
+        features[:, 6] = now.hour
+        features[:, 7] = now.toordinal() - date(now.year, 1, 1).toordinal() + 1
+        
+        return features
     
     def _get_risk_level(self, risk_score: float) -> str:
         """
@@ -210,10 +337,16 @@ class PredictionService:
         wind = request_data['wind_speed']
         
         return {
-            'temperature_factor': round(max(0, (temp - 70) / 40), 3),
-            'humidity_factor': round(max(0, (50 - humidity) / 50), 3),
-            'wind_factor': round(min(1, wind / 20), 3)
+            'temperature_factor': round(max(0.0, (temp - 70) / 40), 3),
+            'humidity_factor': round(max(0.0, (50 - humidity) / 50), 3),
+            'wind_factor': round(min(1.0, wind / 20), 3)
         }
 
-# Global prediction service
-prediction_service = PredictionService()
\ No newline at end of file
+@cache
+def get_prediction_service() -> PredictionService:
+    """
+    Process-wide prediction service, created (model loaded) on first use.
+    
+    Importing this module no longer loads the model.
+    """
+    return PredictionService()
\ No newline at end of file
@@ -7,16 +7,21 @@ import os
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
-load_dotenv()
+# Containers inject env directly, so they can skip reading .env from disk
+if os.environ.get('SKIP_DOTENV') != '1':
+    load_dotenv()
+
+# Snapshot env once; dataclass defaults below read from this dict
+_ENV = dict(os.environ)
 
 @dataclass
 class DatabaseConfig:
     """PostgreSQL connection settings"""
-    host: str = os.getenv('DB_HOST', 'localhost')
-    port: int = int(os.getenv('DB_PORT', '5432'))
-    database: str = os.getenv('DB_NAME', 'emberalert')
-    user: str = os.getenv('DB_USER', 'postgres')
-    password: str = os.getenv('DB_PASSWORD', 'password')
+    host: str = _ENV.get('DB_HOST', 'localhost')
+    port: int = int(_ENV.get('DB_PORT', '5432'))
+    database: str = _ENV.get('DB_NAME', 'emberalert')
+    user: str = _ENV.get('DB_USER', 'postgres')
+    password: str = _ENV.get('DB_PASSWORD', 'password')
     
     def get_url(self) -> str:
         """SQLAlchemy connection string"""
@@ -25,22 +30,22 @@ class DatabaseConfig:
 @dataclass
 class RedisConfig:
     """Redis caching configuration"""
-    host: str = os.getenv('REDIS_HOST', 'localhost')
-    port: int = int(os.getenv('REDIS_PORT', '6379'))
+    host: str = _ENV.get('REDIS_HOST', 'localhost')
+    port: int = int(_ENV.get('REDIS_PORT', '6379'))
     ttl: int = 3600  # Cache for 1 hour
 
 @dataclass
 class WeatherAPIConfig:
     """OpenWeatherMap API settings"""
-    api_key: str = os.getenv('OPENWEATHER_API_KEY', '')
+    api_key: str = _ENV.get('OPENWEATHER_API_KEY', '')
     base_url: str = 'https://api.openweathermap.org/data/2.5'
 
 class Settings:
-    """Main settings object"""
+    """Main settings object (use the module-level `settings` singleton)"""
     def __init__(self):
         self.db = DatabaseConfig()
         self.redis = RedisConfig()
         self.weather = WeatherAPIConfig()
-        self.data_dir = os.getenv('DATA_DIR', './data')
+        self.data_dir = _ENV.get('DATA_DIR', './data')
 
 settings = Settings()
\ No newline at end of file
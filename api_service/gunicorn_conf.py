@@ -0,0 +1,40 @@
+"""
+Gunicorn configuration for the API server.
+
+Run with:
+    gunicorn -c gunicorn_conf.py "app.main:create_app()"
+
+WHY GUNICORN + GEVENT:
+- Flask's dev server handles one request at a time
+- gevent workers overlap Redis round-trips across requests
+- Multiple workers use all CPU cores for XGBoost inference
+"""
+
+# preload_app imports the app (ssl, redis) in the master; patch first so
+# gevent workers don't inherit unpatched modules
+from gevent import monkey
+monkey.patch_all()
+
+from multiprocessing import cpu_count
+from app.config import config as api_config  # "config" is a Gunicorn setting name
+
+bind = f"{api_config.HOST}:{api_config.PORT}"
+
+# Workers
+workers = 2 * cpu_count() + 1
+worker_class = 'gevent'
+worker_connections = 1000  # Concurrent requests per worker
+
+# Load the app once in the master (model warmed in when_ready), then fork.
+# Workers share the model pages copy-on-write; Redis connects per worker.
+preload_app = True
+
+# Logging
+accesslog = '-'
+errorlog = '-'
+
+
+def when_ready(server):
+    """Load the XGBoost model in the master so workers inherit it on fork"""
+    from app.services.prediction_service import get_prediction_service
+    get_prediction_service()
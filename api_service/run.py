@@ -1,5 +1,8 @@
 """
-API server entry point.
+API server entry point (development).
+
+In production run under Gunicorn instead:
+    gunicorn -c gunicorn_conf.py "app.main:create_app()"
 """
 
 from app.main import create_app
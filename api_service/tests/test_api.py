@@ -0,0 +1,88 @@
+import pytest
+import os
+import sys
+
+API_DIR = os.path.join(os.path.dirname(__file__), '..')
+os.environ.setdefault('MODEL_PATH', os.path.join(
+    API_DIR, '..', 'ml_service', 'saved_models', 'fire_risk_xgboost_v1.ubj'
+))
+sys.path.insert(0, API_DIR)
+
+import fakeredis
+import orjson
+from app.main import create_app
+from app.services.cache_service import get_cache_service
+
+@pytest.fixture
+def cache():
+    """Fresh cache service backed by an in-memory fake Redis"""
+    get_cache_service.cache_clear()
+    service = get_cache_service()
+    service._redis_client = fakeredis.FakeRedis()
+    service._connect_attempted = True
+    yield service
+    get_cache_service.cache_clear()
+
+@pytest.fixture
+def client(cache):
+    return create_app().test_client()
+
+@pytest.fixture
+def request_body():
+    return {'latitude': 34.05, 'longitude': -118.25,
+            'temperature': 85.3, 'humidity': 25.0, 'wind_speed': 25.0}
+
+class TestContributingFactors:
+    def test_batch_factors_match_single(self, client, cache, request_body):
+        batch = client.post('/api/v1/predict/batch', json={'predictions': [request_body]})
+        cache.redis_client.flushall()
+        single = client.post('/api/v1/predict', json=request_body)
+
+        batch_factors = orjson.loads(batch.data)['predictions'][0]['contributing_factors']
+        single_factors = orjson.loads(single.data)['contributing_factors']
+        assert batch_factors == single_factors
+        assert (orjson.loads(batch.data)['predictions'][0]['risk_score']
+                == orjson.loads(single.data)['risk_score'])
+        assert all(type(v) is float for v in single_factors.values())
+
+class TestSinglePredictionCache:
+    def test_miss_then_hit_echoes_exact_coordinates(self, client, request_body):
+        miss = client.post('/api/v1/predict', json=request_body)
+        assert miss.status_code == 200
+        assert orjson.loads(miss.data)['from_cache'] is False
+
+        # Same 0.01° cache cell, different exact coordinates
+        nearby = {**request_body, 'latitude': 34.0512, 'longitude': -118.2461}
+        hit = client.post('/api/v1/predict', json=nearby)
+        assert hit.status_code == 200
+        assert hit.mimetype == 'application/json'
+
+        body = orjson.loads(hit.data)  # Spliced bytes must still be valid JSON
+        assert body['from_cache'] is True
+        assert body['latitude'] == 34.0512
+        assert body['longitude'] == -118.2461
+        assert body['risk_score'] == orjson.loads(miss.data)['risk_score']
+
+    def test_stored_entry_omits_per_request_fields(self, client, cache, request_body):
+        client.post('/api/v1/predict', json=request_body)
+        stored = orjson.loads(cache.get_raw(request_body))
+        assert stored
+        assert not {'latitude', 'longitude', 'from_cache'} & set(stored)
+
+class TestOptionalFields:
+    def test_null_optionals_score_like_defaults(self, client, cache, request_body):
+        nulls = client.post('/api/v1/predict',
+                            json={**request_body, 'wind_direction': None, 'pressure': None})
+        assert nulls.status_code == 200
+        cache.redis_client.flushall()
+
+        defaults = client.post('/api/v1/predict', json=request_body)
+        assert orjson.loads(defaults.data)['from_cache'] is False
+        assert orjson.loads(nulls.data)['risk_score'] == orjson.loads(defaults.data)['risk_score']
+
+    def test_null_then_omitted_shares_cache_entry(self, client, request_body):
+        nulls = client.post('/api/v1/predict',
+                            json={**request_body, 'wind_direction': None, 'pressure': None})
+        omitted = client.post('/api/v1/predict', json=request_body)
+        assert orjson.loads(omitted.data)['from_cache'] is True
+        assert orjson.loads(omitted.data)['risk_score'] == orjson.loads(nulls.data)['risk_score']
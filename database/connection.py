@@ -21,7 +21,9 @@ class Database:
             settings.db.get_url(),
             echo=False,  # Set to True to see SQL queries
             pool_size=5,  # Connection pool
-            max_overflow=10
+            max_overflow=10,
+            # Bulk inserts: rows per multi-row INSERT ... VALUES statement
+            insertmanyvalues_page_size=500
         )
         
         # Session factory for ORM operations
@@ -4,29 +4,78 @@ Handles API calls, rate limiting, and error handling.
 """
 
 import requests
+import threading
 import time
-from typing import Dict, Optional
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional
+from sqlalchemy import column, insert, table
 from datetime import datetime
 from config.settings import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Bound once; converts API epoch seconds to the local naive datetimes we store
+_fromtimestamp = datetime.fromtimestamp
+
+# Core table construct for inserts: executemany of insert(WEATHER_TABLE)
+# is folded into multi-row INSERT ... VALUES statements by SQLAlchemy
+WEATHER_TABLE = table(
+    'weather_data',
+    column('latitude'), column('longitude'), column('timestamp'),
+    column('temperature'), column('humidity'),
+    column('wind_speed'), column('wind_direction'),
+    column('conditions'), column('pressure')
+)
+
 class WeatherExtractor:
     """Fetch weather data from OpenWeatherMap"""
     
+    # Recent successful fetches, keyed by rounded (lat, lon). Class-level so
+    # every extractor in the process shares it: run_pipeline builds a new
+    # extractor per run, and repeat runs (e.g. from a scheduler) should hit.
+    # OpenWeatherMap updates roughly every 10 min, so 15 min is fresh enough.
+    _cache = TTLCache(maxsize=1024, ttl=900)
+    _cache_lock = threading.Lock()
+    
     def __init__(self):
         self.api_key = settings.weather.api_key
         self.base_url = settings.weather.base_url
-        self.last_call = 0
+        self._url = f"{self.base_url}/weather"
+        self.last_call = 0.0
         self.min_interval = 1.0  # 1 second between calls
+        self._lock = threading.Lock()
+        
+        # One pooled session: keeps TLS connections to the API warm between
+        # calls, and retries rate limits / transient 5xx with backoff
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
     
     def _rate_limit(self):
-        """Simple rate limiting"""
-        elapsed = time.time() - self.last_call
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_call = time.time()
+        """
+        Thread-safe rate limiting.
+        
+        Each caller reserves the next free slot under the lock, then
+        sleeps outside it, so concurrent fetches start at most once per
+        min_interval but their network waits still overlap.
+        """
+        with self._lock:
+            slot = max(time.monotonic(), self.last_call + self.min_interval)
+            self.last_call = slot
+        
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
     
     def get_current_weather(self, lat: float, lon: float) -> Optional[Dict]:
         """
@@ -39,9 +88,14 @@ class WeatherExtractor:
         Returns:
             Dict with weather data or None on error
         """
+        key = (round(lat, 2), round(lon, 2))
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
         self._rate_limit()
         
-        url = f"{self.base_url}/weather"
         params = {
             'lat': lat,
             'lon': lon,
@@ -50,40 +104,54 @@ class WeatherExtractor:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(self._url, params=params, timeout=10)
             response.raise_for_status()  # Raise error for 4xx/5xx
             
             data = response.json()
             
-            # Transform API response to our format
-            return {
+            # Transform API response to our format (nested dicts read once)
+            main = data['main']
+            wind = data['wind']
+            weather0 = data['weather'][0]
+            weather = {
                 'latitude': lat,
                 'longitude': lon,
-                'timestamp': datetime.fromtimestamp(data['dt']),
-                'temperature': data['main']['temp'],
-                'humidity': data['main']['humidity'],
-                'wind_speed': data['wind']['speed'],
-                'wind_direction': data['wind'].get('deg', 0),
-                'conditions': data['weather'][0]['main'],
-                'pressure': data['main']['pressure']
+                'timestamp': _fromtimestamp(data['dt']),
+                'temperature': main['temp'],
+                'humidity': main['humidity'],
+                'wind_speed': wind['speed'],
+                'wind_direction': wind.get('deg', 0),
+                'conditions': weather0['main'],
+                'pressure': main['pressure']
             }
             
+            # Only successes are cached; failures retry on the next run
+            with self._cache_lock:
+                self._cache[key] = weather
+            
+            return weather
+            
         except requests.exceptions.RequestException as e:
             logger.error(f"Weather API error for ({lat}, {lon}): {e}")
             return None
     
-    def save_to_db(self, weather_data: Dict):
-        """Save weather data to PostgreSQL"""
-        from database.connection import db
+    def save_to_db(self, weather_rows: List[Dict], conn=None):
+        """
+        Save weather rows to PostgreSQL in one bulk INSERT.
         
-        query = """
-        INSERT INTO weather_data 
-        (latitude, longitude, timestamp, temperature, humidity, 
-         wind_speed, wind_direction, conditions, pressure)
-        VALUES 
-        (:latitude, :longitude, :timestamp, :temperature, :humidity,
-         :wind_speed, :wind_direction, :conditions, :pressure)
+        Args:
+            weather_rows: Weather dicts from get_current_weather
+            conn: Open connection to join its transaction (optional)
         """
+        if not weather_rows:
+            return
+        
+        if conn is None:
+            from database.connection import db
+            
+            with db.engine.begin() as conn:
+                conn.execute(insert(WEATHER_TABLE), weather_rows)
+        else:
+            conn.execute(insert(WEATHER_TABLE), weather_rows)
         
-        db.execute_query(query, weather_data)
-        logger.info(f"Saved weather data for ({weather_data['latitude']}, {weather_data['longitude']})")
\ No newline at end of file
+        logger.debug(f"Saved {len(weather_rows)} weather rows")
@@ -28,56 +28,78 @@ class TrainingDataLoader():
       - Fire risk score 0-1
     """
 
-    np.random.seed(42)
-    data = {
-      # normal dist: 75°F avg, 15°F spread, clip to realistic CA range
-      'temperature':np.random.normal(75, 15, n_samples).clip(50, 110), 
-      'humidity': np.random.normal(50, 20, n_samples).clip(10, 90),
-      'wind_speed': np.random.exponential(8, n_samples).clip(0, 40),
-      'wind_direction': np.random.uniform(0, 360, n_samples),
-      'pressure': np.random.normal(1013, 10, n_samples),
-      'month': np.random.randint(1, 13, n_samples),
-      'hour': np.random.randint(0, 24, n_samples),
-      'day_of_year': np.random.randint(1, 366, n_samples),
-    }
-
-    #turns dictionary(data) into a table with 8 columns 
-    df = pd.DataFrame(data)
+    #one generator + one float32 buffer (9 columns incl. target), filled in place
+    #column-major (order='F') so every column slice is contiguous for out=
+    rng = np.random.default_rng(42)
+    arr = np.empty((n_samples, 9), dtype=np.float32, order='F')
+    temp, humidity, wind_speed, wind_dir, pressure, month, hour, doy, target = arr.T
+
+    # normal dist: 75°F avg, 15°F spread, clip to realistic CA range
+    rng.standard_normal(dtype=np.float32, out=temp)
+    temp *= 15
+    temp += 75
+    np.clip(temp, 50, 110, out=temp)
+    rng.standard_normal(dtype=np.float32, out=humidity)
+    humidity *= 20
+    humidity += 50
+    np.clip(humidity, 10, 90, out=humidity)
+    rng.standard_exponential(dtype=np.float32, out=wind_speed)
+    wind_speed *= 8
+    np.clip(wind_speed, 0, 40, out=wind_speed)
+    rng.random(dtype=np.float32, out=wind_dir)
+    wind_dir *= 360
+    rng.standard_normal(dtype=np.float32, out=pressure)
+    pressure *= 10
+    pressure += 1013
+    month[:] = rng.integers(1, 13, n_samples)
+    hour[:] = rng.integers(0, 24, n_samples)
+    doy[:] = rng.integers(1, 366, n_samples)
 
     # Create target: high temp + low humidity + high wind = high risk
-    #target is the answer the model learns to predict 
-    df['target'] = (
-      0.4 * ((df['temperature'] - 50) / 60) +
-            0.3 * (1 - df['humidity'] / 100) +
-            0.3 * (df['wind_speed'] / 40)
-        ).clip(0, 1)
-    
+    #target is the answer the model learns to predict (computed in place, no temporaries)
+    #0.4*(temp-50)/60 + 0.3*(1-humidity/100) + 0.3*wind/40
+    np.subtract(temp, 50, out=target)
+    target *= 0.4 / 60
+    target += 0.3
+    target -= humidity * np.float32(0.3 / 100)
+    target += wind_speed * np.float32(0.3 / 40)
+    np.clip(target, 0, 1, out=target)
+
     # Fire season boost (June-October), so add more risk since fire season months 
-    fire_season = ((df['month'] >= 6) & (df['month'] <= 10)).astype(float)
-    df['target'] = (df['target'] + 0.2 * fire_season).clip(0, 1)
+    target += np.float32(0.2) * ((month >= 6) & (month <= 10))
+    np.clip(target, 0, 1, out=target)
 
     #noise to help model learn variations 
     # Add ±5% random noise to prevent overfitting (model learns pattern, not formula)
-    df['target']+= np.random.normal(0, 0.05, n_samples)
-    df['target'] = df['target'].clip(0, 1)
+    target += rng.normal(0, 0.05, n_samples).astype(np.float32)
+    np.clip(target, 0, 1, out=target)
+
+    #wrap the buffer as a table without copying it
+    df = pd.DataFrame(arr, columns=[
+      'temperature', 'humidity', 'wind_speed', 'wind_direction',
+      'pressure', 'month', 'hour', 'day_of_year', 'target'
+    ], copy=False)
 
     #logger that states whether functionality ran and how much data used 
     logger.info(f"Generated {n_samples} synthetic samples")
     return df
   
+  #model input columns, in the order the API sends them 
+  FEATURE_COLS = [
+        'temperature', 'humidity', 'wind_speed', 'wind_direction',
+        'pressure', 'month', 'hour', 'day_of_year'
+  ]
+
   def prepare_data(self, df:pd.DataFrame, test_size: float = .2):
-    #defines the features 
-    feature_cols = [
-          'temperature', 'humidity', 'wind_speed', 'wind_direction',
-            'pressure', 'month', 'hour', 'day_of_year'
-      ]
-    X = df[feature_cols]  # Features: what model uses to predict
-    y = df['target']      # Target: what model tries to predict
+    #plain float32 arrays: sklearn splits them with one fancy index (no pandas
+    #index copies) and XGBoost takes them as-is. Column names = FEATURE_COLS
+    X = df[self.FEATURE_COLS].to_numpy(dtype=np.float32, copy=False)  # Features: what model uses to predict
+    y = df['target'].to_numpy(dtype=np.float32, copy=False)      # Target: what model tries to predict
 
     #model does not see test data during training which prevents cheating 
     #80% training and 20% testing 
     X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=42
+            X, y, test_size=test_size, random_state=42, shuffle=True
         )
       
     logger.info(f"Train: {len(X_train)} samples, Test: {len(X_test)} samples")
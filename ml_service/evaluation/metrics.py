@@ -3,7 +3,6 @@ Model evaluation metrics. Evaluate how well the model is.
 """
 
 import numpy as np
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 from typing import Dict
 import logging
 
@@ -14,9 +13,6 @@ class ModelEvaluator:
 
     @staticmethod
     def evaluate(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
-        rmse = np.sqrt(mean_squared_error(y_true, y_pred))
-        mae = mean_absolute_error(y_true, y_pred)
-        r2 = r2_score(y_true, y_pred)
         """
         Comprehensive model evaluation.
         
@@ -26,12 +22,30 @@ class ModelEvaluator:
         - R²: Variance explained (1.0 = perfect)
         - MAPE: Mean Absolute Percentage Error
         """
+        y_true = np.asarray(y_true, dtype=np.float64)
+        y_pred = np.asarray(y_pred, dtype=np.float64)
+        n = len(y_true)
+
+        # Residuals once; every metric below is a reduction over them.
+        # Sums come from BLAS dot products (no squared temporaries), and
+        # |err| is shared by MAE and MAPE.
+        err = y_true - y_pred
+        abs_err = np.abs(err)
+        sse = err @ err
+
+        # Centered second pass for SST: stable even when y_true has a large mean
+        dev = y_true - y_true.sum() / n
+        sst = dev @ dev
+
+        rmse = np.sqrt(sse / n)
+        mae = abs_err.sum() / n
+
+        # R² = 1 - SSE/SST (same convention as sklearn for constant y_true)
+        r2 = 1 - sse / sst if sst > 0 else (1.0 if sse == 0 else 0.0)
 
-        rmse = np.sqrt(mean_squared_error(y_true, y_pred))
-        mae = mean_absolute_error(y_true, y_pred)
-        r2 = r2_score(y_true, y_pred)
         # MAPE with clipping to avoid division by zero
-        mape = np.mean(np.abs((y_true - y_pred) / np.clip(y_true, 0.01, None))) * 100
+        np.maximum(y_true, 0.01, out=dev)  # dev no longer needed: reuse its buffer
+        mape = (abs_err / dev).sum() / n * 100
     
         metrics = {
             'rmse': float(rmse),
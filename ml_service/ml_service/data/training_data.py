@@ -6,6 +6,7 @@ Creates train/test splits for model training.
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
+from sqlalchemy import text
 from database.connection import db
 import logging
 
@@ -14,18 +15,27 @@ logger = logging.getLogger(__name__)
 class TrainingDataLoader:
     """Load data from PostgreSQL for ML training"""
     
-    def load_historical_data(self, limit: int = 10000) -> pd.DataFrame:
+    def load_historical_data(
+        self,
+        limit: int = 10000,
+        chunksize: int = 5000
+    ) -> pd.DataFrame:
         """
         Load historical weather and risk data.
         
         In production, you'd load actual historical fire events.
         For this demo, we use recent predictions as training data.
         
+        Rows are streamed from a server-side cursor in chunks and
+        downcast to float32 as they arrive, so the full float64 (or
+        Decimal) result is never held in memory at once.
+        
         Args:
             limit: Max rows to load
+            chunksize: Rows fetched per chunk
         
         Returns:
-            DataFrame with features and target
+            DataFrame with features and target (float32)
         """
         query = """
         SELECT 
@@ -47,7 +57,21 @@ class TrainingDataLoader:
         LIMIT :limit
         """
         
-        df = pd.read_sql(query, db.engine, params={'limit': limit})
+        # stream_results: Postgres sends rows as we read them instead of
+        # buffering the whole result set client-side
+        with db.engine.connect() as conn:
+            conn = conn.execution_options(stream_results=True)
+            chunks = pd.read_sql(
+                text(query), conn,
+                params={'limit': limit},
+                chunksize=chunksize
+            )
+            df = pd.concat(
+                [chunk.astype(np.float32) for chunk in chunks],
+                ignore_index=True,
+                copy=False
+            )
+        
         logger.info(f"Loaded {len(df)} training samples")
         
         return df
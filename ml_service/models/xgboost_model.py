@@ -3,7 +3,7 @@
 import xgboost as xgb 
 import numpy as np 
 from typing import Dict 
-import joblib 
+import json 
 import logging 
 
 logger = logging.getLogger(__name__)
@@ -30,7 +30,9 @@ class FireRiskXGBoost:
             'n_estimators': 100, #number of trees to build 
             'subsample': 0.8, #use 80% of rows per tree to prevent overfitting
             'colsample_bytree': 0.8, # Use 80% of features per tree & also prevents overfitting
-            'random_state': 42
+            'random_state': 42,
+            'tree_method': 'hist', # histogram split finding: fastest CPU path
+            'n_jobs': -1 # use all cores for training
         }
 
     #an override default by passing in thier own params 
@@ -40,39 +42,67 @@ class FireRiskXGBoost:
     self.params = default_params #store params in object 
     self.model = xgb.XGBRegressor(**self.params) #create model with parameters 
     self.feature_names = None #store column names later for feature importance 
+    self.booster = None #trained native booster (shared with self.model after train)
   
 
-  def train(self, X_train, y_train, X_val=None, y_val=None):
-    """Train the model"""
+  def train(self, X_train, y_train, X_val=None, y_val=None, feature_names=None):
+    """Train the model (feature_names labels plain-array input)"""
     logger.info("Training XGBoost model")
 
-    if hasattr(X_train, 'columns'):
+    if feature_names is not None:
+      self.feature_names = list(feature_names)
+    elif hasattr(X_train, 'columns'):
       #save feature names for importance 
       self.feature_names = X_train.columns.tolist()
 
-      eval_set = [(X_train, y_train)]
-      # Track validation error during training
-      # If validation error stops improving → model starting to overfit
-      if X_val is not None and y_val is not None:
-        eval_set.append((X_val, y_val))
-
-      #model studies examples based on training info 
-      self.model.fit(
-            X_train, y_train,
-            eval_set=eval_set,
-            verbose=False
+    #build the quantized training matrix once: float32 in, no per-fit pandas copies
+    dtrain = xgb.QuantileDMatrix(
+          np.asarray(X_train, dtype=np.float32),
+          label=np.asarray(y_train, dtype=np.float32),
+          feature_names=self.feature_names
+    )
+
+    #no training-set entry: it would cost a full predict pass per round
+    #just to log a train RMSE that verbose_eval=False throws away
+    evals = []
+    # Track validation error during training
+    # If validation error stops improving → model starting to overfit
+    if X_val is not None and y_val is not None:
+      #ref=dtrain reuses the training bin edges instead of recomputing them
+      dval = xgb.QuantileDMatrix(
+            np.asarray(X_val, dtype=np.float32),
+            label=np.asarray(y_val, dtype=np.float32),
+            feature_names=self.feature_names,
+            ref=dtrain
       )
-      
-      logger.info("Training completed")
-      return self.model
+      evals.append((dval, 'val'))
+
+    #model studies examples based on training info 
+    #n_estimators is a sklearn name; the native API takes it as num_boost_round
+    booster_params = {k: v for k, v in self.params.items() if k != 'n_estimators'}
+    self.booster = xgb.train(
+          booster_params, dtrain,
+          num_boost_round=self.params['n_estimators'],
+          evals=evals or None,
+          verbose_eval=False
+    )
+
+    #attach to the sklearn wrapper so importances and the saved file keep working
+    self.model._Booster = self.booster
+
+    logger.info("Training completed")
+    return self.model
     
   def predict(self, X) -> np.ndarray:
     # make predictions 
-    #X is run through all the trees 
-    predictions = self.model.predict(X)
+    #X is run through all the trees, straight from the array (no DMatrix per call)
+    predictions = self.booster.inplace_predict(np.asarray(X, dtype=np.float32))
 
     #make predictions into valid range between 0 and 1 
-    return np.clip(predictions, 0, 1)
+    #(squared error can overshoot slightly; only rewrite the array when it did)
+    if predictions.size and (predictions.max() > 1 or predictions.min() < 0):
+      np.clip(predictions, 0, 1, out=predictions)
+    return predictions
 
   def get_feature_importance(self) -> Dict[str, float]:
     """Get feature importance scores"""
@@ -88,12 +118,20 @@ class FireRiskXGBoost:
       return dict(enumerate(importances))
   
   def save(self, filepath: str):
-        """Save model to disk and joblib saves python object to a file"""
-        joblib.dump({
-            'model': self.model,
-            'params': self.params,
-            'feature_names': self.feature_names
-        }, filepath)
+        """
+        Save model to disk with XGBoost's native format.
+
+        The booster goes to filepath (.ubj = compact binary JSON, .json = text),
+        params and feature names to a small sidecar filepath + '.meta.json'.
+        No pickle: portable across XGBoost versions and safe to load.
+        """
+        self.booster.save_model(filepath)
+
+        with open(filepath + '.meta.json', 'w') as f:
+            json.dump({
+                'params': self.params,
+                'feature_names': self.feature_names
+            }, f)
         # Save everything needed to recreate this exact model, so no need to retrain every time 
         
         logger.info(f"Model saved to {filepath}")
@@ -101,34 +139,20 @@ class FireRiskXGBoost:
   @classmethod
   def load(cls, filepath: str):
     """load model from disk"""
-    #load dictionary into model 
-    data = joblib.load(filepath)
+    #load params + feature names from the sidecar 
+    with open(filepath + '.meta.json') as f:
+      meta = json.load(f)
 
     # create new fireriskxgboost instance with original params 
-    instance = cls(params=data['params'])
+    instance = cls(params=meta['params'])
 
-    #restore trained model 
-    instance.model = data['model']
+    #restore trained booster and attach it to the sklearn wrapper 
+    instance.booster = xgb.Booster()
+    instance.booster.load_model(filepath)
+    instance.model._Booster = instance.booster
 
     # Restore feature names
-    instance.feature_names = data['feature_names']
+    instance.feature_names = meta['feature_names']
 
     logger.info(f"Model loaded from {filepath}")
     return instance
-
-
-
-
-
-  
-
-
-
-      
-    
-    
-  
-
-
-
-
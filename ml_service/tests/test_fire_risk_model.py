@@ -55,6 +55,12 @@ class TestTraining:
         model.train(sample_features, sample_labels)
         assert model.feature_names == ['temperature', 'humidity', 'wind_speed', 'latitude', 'longitude']
 
+    def test_feature_names_from_argument_for_arrays(self, sample_features, sample_labels):
+        model = FireRiskXGBoost()
+        model.train(sample_features.to_numpy(), sample_labels,
+                    feature_names=list(sample_features.columns))
+        assert set(model.get_feature_importance()) == set(sample_features.columns)
+
     def test_train_with_validation_set(self, sample_features, sample_labels):
         model = FireRiskXGBoost()
         model.train(sample_features.iloc[:3], sample_labels[:3],
@@ -92,13 +98,19 @@ class TestFeatureImportance:
 class TestSaveLoad:
     def test_save_creates_file(self, trained_model):
         with tempfile.TemporaryDirectory() as tmpdir:
-            path = os.path.join(tmpdir, 'model.pkl')
+            path = os.path.join(tmpdir, 'model.ubj')
             trained_model.save(path)
             assert os.path.exists(path)
 
+    def test_save_writes_metadata_sidecar(self, trained_model):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'model.ubj')
+            trained_model.save(path)
+            assert os.path.exists(path + '.meta.json')
+
     def test_load_restores_predictions(self, trained_model, sample_features):
         with tempfile.TemporaryDirectory() as tmpdir:
-            path = os.path.join(tmpdir, 'model.pkl')
+            path = os.path.join(tmpdir, 'model.ubj')
             trained_model.save(path)
             loaded = FireRiskXGBoost.load(path)
             np.testing.assert_array_almost_equal(
@@ -108,7 +120,7 @@ class TestSaveLoad:
 
     def test_load_restores_feature_names(self, trained_model):
         with tempfile.TemporaryDirectory() as tmpdir:
-            path = os.path.join(tmpdir, 'model.pkl')
+            path = os.path.join(tmpdir, 'model.ubj')
             trained_model.save(path)
             loaded = FireRiskXGBoost.load(path)
             assert loaded.feature_names == trained_model.feature_names
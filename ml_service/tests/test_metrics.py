@@ -0,0 +1,51 @@
+import pytest
+import numpy as np
+import pandas as pd
+import os
+import sys
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from evaluation.metrics import ModelEvaluator
+
+def _cases():
+    rng = np.random.default_rng(0)
+    unit = rng.random(1000)
+    large = 1e4 + rng.normal(0, 1e-3, 1000)
+    skewed = rng.exponential(2.0, 1000)
+    return {
+        'unit_interval': (unit, unit + rng.normal(0, 0.1, 1000)),
+        'large_mean_small_spread': (large, large + rng.normal(0, 1e-4, 1000)),
+        'skewed': (skewed, skewed * 0.9 + rng.normal(0, 0.2, 1000)),
+    }
+
+CASES = _cases()
+
+class TestEvaluate:
+    @pytest.mark.parametrize('name', list(CASES))
+    def test_matches_sklearn(self, name):
+        y_true, y_pred = CASES[name]
+        metrics = ModelEvaluator.evaluate(y_true, y_pred)
+        assert metrics['rmse'] == pytest.approx(np.sqrt(mean_squared_error(y_true, y_pred)), rel=1e-9)
+        assert metrics['mae'] == pytest.approx(mean_absolute_error(y_true, y_pred), rel=1e-9)
+        assert metrics['r2_score'] == pytest.approx(r2_score(y_true, y_pred), rel=1e-6)
+
+    def test_mape_uses_clipped_denominator(self):
+        y_true, y_pred = CASES['unit_interval']
+        expected = np.mean(np.abs((y_true - y_pred) / np.clip(y_true, 0.01, None))) * 100
+        assert ModelEvaluator.evaluate(y_true, y_pred)['mape'] == pytest.approx(expected)
+
+    def test_accepts_pandas_series(self):
+        y_true, y_pred = CASES['unit_interval']
+        metrics = ModelEvaluator.evaluate(pd.Series(y_true), y_pred)
+        assert metrics['r2_score'] == pytest.approx(r2_score(y_true, y_pred), rel=1e-6)
+
+    def test_does_not_modify_inputs(self):
+        y_true, y_pred = CASES['skewed']
+        before = y_true.copy()
+        ModelEvaluator.evaluate(y_true, y_pred)
+        np.testing.assert_array_equal(y_true, before)
+
+    def test_perfect_constant_prediction(self):
+        y = np.full(100, 0.3)
+        assert ModelEvaluator.evaluate(y, y)['r2_score'] == 1.0
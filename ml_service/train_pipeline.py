@@ -31,7 +31,7 @@ def main():
   # STEP 2: Train mode
   logger.info("\nStep 2: Training XGBoost model...")
   model = FireRiskXGBoost()
-  model.train(X_train, y_train, X_test, y_test)
+  model.train(X_train, y_train, X_test, y_test, feature_names=loader.FEATURE_COLS)
 
   # STEP 3: Evaluate
   logger.info("\nStep 3: Evaluating model...")
@@ -51,7 +51,7 @@ def main():
   save_dir = Path('saved_models')
   save_dir.mkdir(exist_ok=True)
     
-  model_path = save_dir / 'fire_risk_xgboost_v1.pkl'
+  model_path = save_dir / 'fire_risk_xgboost_v1.ubj'
   model.save(str(model_path))
     
   print("\n" + "="*60)
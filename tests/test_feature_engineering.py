@@ -0,0 +1,80 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from transformers.feature_engineering import FeatureEngineer
+
+@pytest.fixture
+def engineer():
+    return FeatureEngineer()
+
+@pytest.fixture
+def weather_rows():
+    return [
+        # Typical hot, dry, windy day in fire season
+        {'temperature': 95.37, 'humidity': 17.6, 'wind_speed': 22.4,
+         'timestamp': datetime(2024, 7, 15, 14), 'conditions': 'Clear'},
+        # Cool and wet, outside fire season
+        {'temperature': 55.0, 'humidity': 88.0, 'wind_speed': 3.1,
+         'timestamp': datetime(2024, 1, 2, 3), 'conditions': 'Rain'},
+        # Exactly on every threshold
+        {'temperature': FeatureEngineer.TEMP_HIGH, 'humidity': FeatureEngineer.HUMIDITY_LOW,
+         'wind_speed': FeatureEngineer.WIND_HIGH,
+         'timestamp': datetime(2024, 6, 1, 0), 'conditions': 'Clouds'},
+        # Unknown condition, fire season edge month
+        {'temperature': 110.0, 'humidity': 5.0, 'wind_speed': 40.0,
+         'timestamp': datetime(2024, 10, 31, 23), 'conditions': 'Smoke'},
+        # Far outside the thresholds, just after fire season
+        {'temperature': -40.0, 'humidity': 100.0, 'wind_speed': 0.0,
+         'timestamp': datetime(2024, 11, 1, 12), 'conditions': 'Snow'},
+    ]
+
+class TestBatchParity:
+    def test_batch_matches_scalar_column_by_column(self, engineer, weather_rows):
+        batch = engineer.create_features_batch(pd.DataFrame(weather_rows))
+        scalar = pd.DataFrame([engineer.create_features(w) for w in weather_rows])
+
+        assert list(batch.columns) == list(scalar.columns)
+        for col in scalar.columns:
+            np.testing.assert_allclose(
+                batch[col].to_numpy(dtype=float), scalar[col].to_numpy(dtype=float),
+                rtol=0, atol=1e-12, err_msg=col
+            )
+
+    def test_threshold_values_give_half_risk(self, engineer, weather_rows):
+        features = engineer.create_features_batch(pd.DataFrame(weather_rows[2:3])).iloc[0]
+        assert features['temp_risk'] == pytest.approx(0.5)
+        assert features['humidity_risk'] == pytest.approx(0.5)
+        assert features['wind_risk'] == pytest.approx(0.5)
+
+    def test_risks_stay_in_unit_interval(self, engineer, weather_rows):
+        features = engineer.create_features_batch(pd.DataFrame(weather_rows))
+        for col in ('temp_risk', 'humidity_risk', 'wind_risk'):
+            assert features[col].between(0, 1).all()
+
+    def test_unknown_condition_maps_to_half(self, engineer, weather_rows):
+        features = engineer.create_features_batch(pd.DataFrame(weather_rows))
+        assert features['condition_risk'].iloc[3] == 0.5
+        assert engineer.create_features(weather_rows[3])['condition_risk'] == 0.5
+
+    def test_missing_conditions_treated_as_clear(self, engineer, weather_rows):
+        rows = [{k: v for k, v in w.items() if k != 'conditions'} for w in weather_rows]
+        batch = engineer.create_features_batch(pd.DataFrame(rows))
+        assert (batch['condition_risk'] == FeatureEngineer.CONDITION_RISK['Clear']).all()
+        assert engineer.create_features(rows[0])['condition_risk'] == FeatureEngineer.CONDITION_RISK['Clear']
+
+        partial = pd.DataFrame(weather_rows).astype({'conditions': object})
+        partial.loc[1, 'conditions'] = None
+        assert engineer.create_features_batch(partial)['condition_risk'].iloc[1] == 0.8
+
+class TestRiskLabels:
+    def test_batch_labels_match_scalar_at_cut_points(self, engineer):
+        scores = np.array([0.0, 0.2999, 0.3, 0.5999, 0.6, 0.7999, 0.8, 1.0])
+        expected = [engineer.create_risk_label(s) for s in scores]
+        assert engineer.create_risk_labels(scores).tolist() == expected
+        assert expected == ['LOW', 'LOW', 'MODERATE', 'MODERATE',
+                            'HIGH', 'HIGH', 'EXTREME', 'EXTREME']
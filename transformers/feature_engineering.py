@@ -3,6 +3,8 @@ Feature engineering for fire risk prediction.
 Transforms raw weather data into ML-ready features.
 """
 
+import math
+from bisect import bisect_right
 import pandas as pd
 import numpy as np
 from typing import Dict
@@ -19,6 +21,25 @@ class FeatureEngineer:
     HUMIDITY_LOW = 30.0   # Percent
     WIND_HIGH = 15.0      # mph
     
+    # Weather condition -> risk, as a lookup table indexed by category code
+    _COND_KEYS = ('Clear', 'Clouds', 'Rain', 'Drizzle', 'Thunderstorm', 'Snow')
+    _COND_LUT = np.array([
+        0.8,    # Clear: high risk (no clouds)
+        0.5,    # Clouds
+        0.1,    # Rain: low risk
+        0.2,    # Drizzle
+        0.3,    # Thunderstorm
+        0.0     # Snow
+    ])
+    CONDITION_RISK = dict(zip(_COND_KEYS, _COND_LUT.tolist()))
+    _COND_INDEX = pd.Index(_COND_KEYS)
+    
+    # Risk level cut points and names (see create_risk_label)
+    _THRESHOLDS_LIST = [0.3, 0.6, 0.8]
+    _THRESHOLDS = np.array(_THRESHOLDS_LIST)
+    _LABEL_NAMES = ('LOW', 'MODERATE', 'HIGH', 'EXTREME')
+    _LABELS = np.array(_LABEL_NAMES)
+    
     def create_features(self, weather_data: Dict) -> Dict:
         """
         Engineer features from weather observation.
@@ -98,21 +119,100 @@ class FeatureEngineer:
         
         # === CATEGORICAL ENCODING ===
         # Convert conditions to numeric
-        condition_map = {
-            'Clear': 0.8,      # High risk (no clouds)
-            'Clouds': 0.5,
-            'Rain': 0.1,       # Low risk
-            'Drizzle': 0.2,
-            'Thunderstorm': 0.3,
-            'Snow': 0.0
-        }
-        features['condition_risk'] = condition_map.get(
+        features['condition_risk'] = _condition_risk(
             weather_data.get('conditions', 'Clear'),
             0.5
         )
         
         return features
     
+    def create_features_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Engineer features for many observations at once.
+        
+        Same features as create_features, computed as whole-column
+        NumPy operations instead of one Python dict per row.
+        
+        Args:
+            df: Raw weather rows (one per observation)
+        
+        Returns:
+            DataFrame of features, aligned with df's index
+        """
+        features = pd.DataFrame(index=df.index)
+        
+        # === INDIVIDUAL RISKS ===
+        temp = df['temperature'].to_numpy(dtype=np.float64)
+        humidity = df['humidity'].to_numpy(dtype=np.float64)
+        wind_speed = df['wind_speed'].to_numpy(dtype=np.float64)
+        
+        features['temperature'] = df['temperature']
+        features['temp_risk'] = self._normalize_risk_array(
+            temp, self.TEMP_HIGH, higher_is_riskier=True
+        )
+        features['humidity'] = df['humidity']
+        features['humidity_risk'] = self._normalize_risk_array(
+            humidity, self.HUMIDITY_LOW, higher_is_riskier=False
+        )
+        features['wind_speed'] = df['wind_speed']
+        features['wind_risk'] = self._normalize_risk_array(
+            wind_speed, self.WIND_HIGH, higher_is_riskier=True
+        )
+        
+        # === COMPOSITE RISK SCORE ===
+        features['composite_risk'] = (
+            0.4 * features['temp_risk'] +
+            0.3 * features['humidity_risk'] +
+            0.3 * features['wind_risk']
+        )
+        
+        # === TEMPORAL FEATURES ===
+        timestamp = pd.to_datetime(df['timestamp'])
+        features['month'] = timestamp.dt.month
+        features['hour'] = timestamp.dt.hour
+        features['day_of_year'] = timestamp.dt.dayofyear
+        features['is_fire_season'] = timestamp.dt.month.between(6, 10).astype(np.int8)
+        
+        # === INTERACTION FEATURES ===
+        features['temp_humidity_interaction'] = (
+            features['temp_risk'] * features['humidity_risk']
+        )
+        features['wind_temp_interaction'] = (
+            features['wind_risk'] * features['temp_risk']
+        )
+        
+        # === CATEGORICAL ENCODING ===
+        # Positions in _COND_KEYS index straight into the LUT; unknown -> -1 -> 0.5
+        conditions = (
+            df['conditions'].fillna('Clear')
+            if 'conditions' in df else pd.Series('Clear', index=df.index)
+        )
+        idx = self._COND_INDEX.get_indexer(conditions)
+        features['condition_risk'] = np.where(idx < 0, 0.5, self._COND_LUT[idx])
+        
+        return features
+    
+    def _normalize_risk_array(
+        self,
+        values: np.ndarray,
+        threshold: float,
+        higher_is_riskier: bool = True
+    ) -> np.ndarray:
+        """Vectorized _normalize_risk over a whole column"""
+        if higher_is_riskier:
+            normalized = (values - threshold) / threshold
+        else:
+            normalized = (threshold - values) / threshold
+        
+        # Sigmoid in closed tanh form: 1/(1+e^(-5x)) == 0.5 + 0.5*tanh(2.5x).
+        # Vectorized tanh is cheaper than exp + divide, and it is already
+        # bounded to [0, 1], so no clip pass is needed
+        risk = np.tanh(2.5 * normalized)
+        risk *= 0.5
+        risk += 0.5
+        
+        return risk
+    
     def _normalize_risk(
         self, 
         value: float, 
@@ -144,10 +244,13 @@ class FeatureEngineer:
             # Low values are dangerous
             normalized = (threshold - value) / threshold
         
-        # Apply sigmoid
-        risk = 1 / (1 + np.exp(-5 * normalized))
+        # Apply sigmoid (math.exp: scalar input, no 0-d array round-trip)
+        try:
+            risk = 1.0 / (1.0 + math.exp(-5.0 * normalized))
+        except OverflowError:
+            risk = 0.0  # Far below threshold (np.exp gave inf here)
         
-        return float(np.clip(risk, 0, 1))  # Ensure 0-1 range
+        return 0.0 if risk < 0 else 1.0 if risk > 1 else risk  # Ensure 0-1 range
     
     def create_risk_label(self, risk_score: float) -> str:
         """
@@ -159,11 +262,14 @@ class FeatureEngineer:
         - HIGH: 0.6-0.8
         - EXTREME: 0.8-1.0
         """
-        if risk_score < 0.3:
-            return 'LOW'
-        elif risk_score < 0.6:
-            return 'MODERATE'
-        elif risk_score < 0.8:
-            return 'HIGH'
-        else:
-            return 'EXTREME'
\ No newline at end of file
+        # bisect_right: a score exactly on a cut point goes to the upper level
+        return self._LABEL_NAMES[bisect_right(self._THRESHOLDS_LIST, risk_score)]
+    
+    def create_risk_labels(self, risk_scores: np.ndarray) -> np.ndarray:
+        """Vectorized create_risk_label: bucketize all scores in one call"""
+        return self._LABELS[
+            np.searchsorted(self._THRESHOLDS, risk_scores, side='right')
+        ]
+
+# Bound once at import: create_features looks conditions up through this
+_condition_risk = FeatureEngineer.CONDITION_RISK.get